@@ -6,7 +6,12 @@ and the TikToken (cl100k_base) tokenizer.
 
 from fastapi import FastAPI, HTTPException, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from collections.abc import Sequence
+from functools import lru_cache
 import re
 import urllib.request
 import os
@@ -14,7 +19,7 @@ import tiktoken
 import io
 import pypdf
 
-app = FastAPI(title="Tokenizer Demo API")
+app = FastAPI(title="Tokenizer Demo API", default_response_class=ORJSONResponse)
 
 _frontend_url = os.environ.get("FRONTEND_URL", "")
 _origins = [o for o in ["http://localhost:5173", "http://localhost:3000", _frontend_url] if o]
@@ -26,6 +31,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # ──────────────────────────────────────────────────────────
 # Simple Tokenizer — built from the combined books corpus
@@ -72,17 +78,44 @@ _build_vocab()
 # TikToken
 # ──────────────────────────────────────────────────────────
 
-tiktoken_enc = tiktoken.get_encoding("cl100k_base")
+TIKTOKEN_ENCODING = "cl100k_base"
+
+tiktoken_enc = tiktoken.get_encoding(TIKTOKEN_ENCODING)
+tiktoken_vocab_size: int = tiktoken_enc.n_vocab
+
+# Only short, frequently repeated inputs are memoized. Longer texts (pasted
+# or extracted documents, where every edit is a new key) bypass the cache,
+# which keeps a full cache to a few MB.
+TIKTOKEN_CACHE_MAX_CHARS = 2_000
+
+
+@lru_cache(maxsize=256)
+def _tiktoken_tokenize(text: str) -> tuple[tuple[int, ...], tuple[str, ...]]:
+    # Unlike the simple tokenizer, whose vocabulary grows through
+    # /api/vocab/add, this only depends on the text and is safe to cache.
+    ids = tiktoken_enc.encode(text, disallowed_special=())
+    strs = [b.decode("utf-8", errors="replace") for b in tiktoken_enc.decode_tokens_bytes(ids)]
+    return tuple(ids), tuple(strs)
+
+
+def _tiktoken_tokens(text: str) -> tuple[tuple[int, ...], tuple[str, ...]]:
+    if len(text) > TIKTOKEN_CACHE_MAX_CHARS:
+        return _tiktoken_tokenize.__wrapped__(text)
+    return _tiktoken_tokenize(text)
 
 # ──────────────────────────────────────────────────────────
 # Request / Response models
 # ──────────────────────────────────────────────────────────
 
 class TokenizeRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     text: str
 
 
 class AddTokensRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     tokens: list[str]
 
 
@@ -118,8 +151,24 @@ def health():
 def vocab_info():
     return {
         "simple_vocab_size": vocab_size_simple,
-        "tiktoken_vocab_size": tiktoken_enc.n_vocab,
-        "tiktoken_encoding": "cl100k_base",
+        "tiktoken_vocab_size": tiktoken_vocab_size,
+        "tiktoken_encoding": TIKTOKEN_ENCODING,
+    }
+
+
+def _tokenizer_result(
+    strs: Sequence[str], ids: Sequence[int], unk: Sequence[bool], vocab_size: int, name: str
+) -> dict:
+    # Tokens are computed column-wise and only zipped into per-token
+    # objects here; plain dicts skip building a TokenInfo per token that
+    # FastAPI would dump and re-validate against response_model anyway.
+    return {
+        "tokens": [
+            {"token": t, "token_id": i, "is_unk": u} for t, i, u in zip(strs, ids, unk)
+        ],
+        "token_count": len(ids),
+        "vocab_size": vocab_size,
+        "tokenizer_name": name,
     }
 
 
@@ -130,36 +179,23 @@ def tokenize(req: TokenizeRequest):
         raise HTTPException(status_code=400, detail="text must not be empty")
 
     # — Simple tokenizer —
-    raw_tokens = _tokenize_regex(text)
-    simple_tokens: list[TokenInfo] = []
-    for tok in raw_tokens:
-        is_unk = tok not in word_to_id
-        tid = word_to_id.get(tok, word_to_id["<UNK>"])
-        simple_tokens.append(TokenInfo(token=tok, token_id=tid, is_unk=is_unk))
+    simple_strs = _tokenize_regex(text)
+    unk_id = word_to_id["<UNK>"]
+    simple_ids = [word_to_id.get(tok, unk_id) for tok in simple_strs]
+    simple_unk = [tok not in word_to_id for tok in simple_strs]
 
     # — TikToken —
-    tt_ids = tiktoken_enc.encode(text)
-    tiktoken_tokens: list[TokenInfo] = []
-    for tid in tt_ids:
-        token_bytes = tiktoken_enc.decode_single_token_bytes(tid)
-        token_str = token_bytes.decode("utf-8", errors="replace")
-        tiktoken_tokens.append(TokenInfo(token=token_str, token_id=tid, is_unk=False))
-
-    return TokenizeResponse(
-        character_count=len(text),
-        simple=TokenizerResult(
-            tokens=simple_tokens,
-            token_count=len(simple_tokens),
-            vocab_size=vocab_size_simple,
-            tokenizer_name="Simple Tokenizer",
+    tt_ids, tt_strs = _tiktoken_tokens(text)
+
+    return {
+        "character_count": len(text),
+        "simple": _tokenizer_result(
+            simple_strs, simple_ids, simple_unk, vocab_size_simple, "Simple Tokenizer"
         ),
-        tiktoken=TokenizerResult(
-            tokens=tiktoken_tokens,
-            token_count=len(tiktoken_tokens),
-            vocab_size=tiktoken_enc.n_vocab,
-            tokenizer_name="TikToken (cl100k_base)",
+        "tiktoken": _tokenizer_result(
+            tt_strs, tt_ids, [False] * len(tt_ids), tiktoken_vocab_size, "TikToken (cl100k_base)"
         ),
-    )
+    }
 
 
 @app.get("/api/example-text")
@@ -173,15 +209,27 @@ def example_text():
     }
 
 
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+
+
+def _extract_pdf_text(content: bytes) -> str:
+    pdf_file = io.BytesIO(content)
+    reader = pypdf.PdfReader(pdf_file)
+    pages = (page.extract_text() for page in reader.pages)
+    return "\n".join(p for p in pages if p).strip()
+
+
 @app.post("/api/extract-text")
 async def extract_text(file: UploadFile = File(...)):
     if not file.filename:
         raise HTTPException(status_code=400, detail="No file uploaded")
     
     filename = file.filename.lower()
-    content = await file.read()
+    # Read at most one byte past the limit so oversized uploads are
+    # rejected without pulling the whole file into memory.
+    content = await file.read(MAX_UPLOAD_BYTES + 1)
     
-    if len(content) > 10 * 1024 * 1024:
+    if len(content) > MAX_UPLOAD_BYTES:
         raise HTTPException(status_code=413, detail="File too large. Maximum size is 10MB.")
     
     try:
@@ -189,14 +237,9 @@ async def extract_text(file: UploadFile = File(...)):
             text = content.decode("utf-8")
             return {"text": text}
         elif filename.endswith(".pdf"):
-            pdf_file = io.BytesIO(content)
-            reader = pypdf.PdfReader(pdf_file)
-            text = ""
-            for page in reader.pages:
-                extracted = page.extract_text()
-                if extracted:
-                    text += extracted + "\n"
-            return {"text": text.strip()}
+            # PDF parsing is CPU-bound; keep it off the event loop.
+            text = await run_in_threadpool(_extract_pdf_text, content)
+            return {"text": text}
         else:
             raise HTTPException(status_code=400, detail="Unsupported file format. Please upload .txt or .pdf files.")
     except HTTPException:
@@ -211,7 +254,7 @@ def add_tokens(req: AddTokensRequest):
     added_count = 0
     rejected_tokens = []
     for token in req.tokens:
-        tt_ids = tiktoken_enc.encode(token)
+        tt_ids = tiktoken_enc.encode(token, disallowed_special=())
         if len(tt_ids) == 1:
             if token not in word_to_id:
                 new_id = len(word_to_id)
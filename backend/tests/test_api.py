@@ -10,6 +10,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import pytest
 from fastapi.testclient import TestClient
+import main
 from main import app
 
 client = TestClient(app)
@@ -175,15 +176,34 @@ class TestTokenizeEndpoint:
         assert resp.status_code == 200
         assert resp.json()["tiktoken"]["token_count"] > 0
 
+    def test_large_response_is_gzipped(self):
+        text = "The quick brown fox jumps over the lazy dog. " * 50
+        resp = client.post(
+            "/api/tokenize", json={"text": text}, headers={"Accept-Encoding": "gzip"}
+        )
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.json()["character_count"] == len(text)
+
     def test_missing_text_field_returns_422(self):
         resp = client.post("/api/tokenize", json={})
         assert resp.status_code == 422
 
+    def test_unknown_field_returns_422(self):
+        resp = client.post("/api/tokenize", json={"text": "hello", "model": "gpt-4"})
+        assert resp.status_code == 422
+
     def test_single_character(self):
         resp = client.post("/api/tokenize", json={"text": "a"})
         assert resp.status_code == 200
         assert resp.json()["character_count"] == 1
 
+    def test_special_token_text_is_encoded_as_plain_text(self):
+        resp = client.post("/api/tokenize", json={"text": "hello <|endoftext|>"})
+        assert resp.status_code == 200
+        tt_tokens = [t["token"] for t in resp.json()["tiktoken"]["tokens"]]
+        assert "<|endoftext|>" not in tt_tokens
+        assert "".join(tt_tokens) == "hello <|endoftext|>"
+
 
 # ──────────────────────────────────────────────────────────
 # POST /api/extract-text
@@ -285,6 +305,23 @@ class TestVocabAddEndpoint:
 
         assert size1 == size2
 
+    def test_rejected_token_queued_once(self, tmp_path, monkeypatch):
+        pending_path = tmp_path / "pending_bpe_tokens.txt"
+        monkeypatch.setattr(main, "PENDING_BPE_PATH", str(pending_path))
+        client.post("/api/vocab/add", json={"tokens": ["supercalifragilistic"]})
+        client.post("/api/vocab/add", json={"tokens": ["supercalifragilistic"]})
+        lines = pending_path.read_text(encoding="utf-8").splitlines()
+        assert lines == ["supercalifragilistic"]
+
+    def test_special_token_text_is_rejected(self, tmp_path, monkeypatch):
+        pending_path = tmp_path / "pending_bpe_tokens.txt"
+        monkeypatch.setattr(main, "PENDING_BPE_PATH", str(pending_path))
+        resp = client.post("/api/vocab/add", json={"tokens": ["<|fim_prefix|>"]})
+        assert resp.status_code == 200
+        assert "<|fim_prefix|>" in resp.json()["rejected_tokens"]
+        lines = pending_path.read_text(encoding="utf-8").splitlines()
+        assert lines == ["<|fim_prefix|>"]
+
     def test_empty_tokens_list(self):
         resp = client.post("/api/vocab/add", json={"tokens": []})
         assert resp.status_code == 200
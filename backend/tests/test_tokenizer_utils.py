@@ -9,7 +9,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 import pytest
-from main import _tokenize_regex
+from main import _tokenize_regex, _tiktoken_tokenize, _tiktoken_tokens, TIKTOKEN_CACHE_MAX_CHARS
 
 
 # ──────────────────────────────────────────────────────────
@@ -114,3 +114,36 @@ class TestTokenizeRegex:
         result = _tokenize_regex(text)
         for punct in [",", ".", ":", ";", "?", "_", "!", "(", ")", '"', "'", "--"]:
             assert punct in result, f"Expected '{punct}' to be a token"
+
+
+# ──────────────────────────────────────────────────────────
+# _tiktoken_tokens
+# ──────────────────────────────────────────────────────────
+
+class TestTiktokenTokens:
+    def test_ids_and_strings_align(self):
+        ids, strs = _tiktoken_tokens("hello world")
+        assert len(ids) == len(strs)
+        assert "".join(strs) == "hello world"
+
+    def test_repeated_text_is_served_from_cache(self):
+        text = "cache me if you can"
+        first = _tiktoken_tokens(text)
+        hits = _tiktoken_tokenize.cache_info().hits
+        assert _tiktoken_tokens(text) == first
+        assert _tiktoken_tokenize.cache_info().hits == hits + 1
+
+    def test_text_at_cutoff_is_cached(self):
+        text = "b" * TIKTOKEN_CACHE_MAX_CHARS
+        _tiktoken_tokens(text)
+        hits = _tiktoken_tokenize.cache_info().hits
+        _tiktoken_tokens(text)
+        assert _tiktoken_tokenize.cache_info().hits == hits + 1
+
+    def test_long_text_is_not_cached(self):
+        text = "a" * (TIKTOKEN_CACHE_MAX_CHARS + 1)
+        size = _tiktoken_tokenize.cache_info().currsize
+        ids, strs = _tiktoken_tokens(text)
+        assert len(ids) == len(strs)
+        assert "".join(strs) == text
+        assert _tiktoken_tokenize.cache_info().currsize == size
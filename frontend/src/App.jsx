@@ -116,8 +116,16 @@ export default function App() {
     }
   };
 
-  const handleTokensAdded = () => {
+  // The add response already carries the new vocabulary size, so update
+  // the badge locally; only re-fetch /api/vocab-info if there is nothing
+  // to update (e.g. the initial fetch failed). The update is functional
+  // because TokenizerPanel calls this after an await.
+  const handleTokensAdded = (newVocabSize) => {
     setRefreshKey(k => k + 1);
+    if (vocabInfo && typeof newVocabSize === 'number') {
+      setVocabInfo(v => v && { ...v, simple_vocab_size: newVocabSize });
+      return;
+    }
     fetch(`${API}/api/vocab-info`)
       .then(r => r.json())
       .then(setVocabInfo)
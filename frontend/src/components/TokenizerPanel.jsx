@@ -84,10 +84,10 @@ export default function TokenizerPanel({ result, isSimple, onTokensAdded }) {
         const data = await res.json();
         if (data.rejected_tokens && data.rejected_tokens.length > 0) {
           setRejectedTokens(data.rejected_tokens);
-          if (data.added_count > 0 && onTokensAdded) onTokensAdded();
+          if (data.added_count > 0 && onTokensAdded) onTokensAdded(data.new_vocab_size);
         } else {
           setReviewing(false);
-          if (onTokensAdded) onTokensAdded();
+          if (onTokensAdded) onTokensAdded(data.new_vocab_size);
         }
       }
     } catch (e) {
@@ -275,6 +275,80 @@ describe('App — result display', () => {
   });
 });
 
+// ─────────────────────────────────────────────
+// Adding unknown tokens
+// ─────────────────────────────────────────────
+
+describe('App — adding tokens', () => {
+  const UNK_RESULT = {
+    ...MOCK_RESULT,
+    simple: {
+      ...MOCK_RESULT.simple,
+      tokens: [{ token: 'xyzzyquux', token_id: 17574, is_unk: true }],
+      token_count: 1,
+    },
+  };
+
+  function makeAddFetch({ vocabInfoOk = true } = {}) {
+    return vi.fn((url) => {
+      if (url.includes('vocab-info')) {
+        if (!vocabInfoOk) return Promise.reject(new Error('Network error'));
+        return Promise.resolve({ ok: true, json: () => Promise.resolve(MOCK_VOCAB) });
+      }
+      if (url.includes('vocab/add')) {
+        return Promise.resolve({
+          ok: true,
+          json: () => Promise.resolve({
+            status: 'success',
+            added_count: 1,
+            new_vocab_size: 17577,
+            rejected_tokens: [],
+          }),
+        });
+      }
+      return Promise.resolve({ ok: true, json: () => Promise.resolve(UNK_RESULT) });
+    });
+  }
+
+  async function addUnknownToken() {
+    render(<App />);
+    await act(async () => { await Promise.resolve(); });
+    const textarea = screen.getByPlaceholderText(/enter text here/i);
+    await act(async () => {
+      fireEvent.change(textarea, { target: { value: 'xyzzyquux' } });
+    });
+    await act(async () => {
+      vi.advanceTimersByTime(400);
+      await Promise.resolve();
+      await Promise.resolve();
+    });
+    await waitFor(() => screen.getByRole('button', { name: /review new tokens/i }));
+    fireEvent.click(screen.getByRole('button', { name: /review new tokens/i }));
+    fireEvent.click(screen.getByRole('button', { name: /approve & add/i }));
+  }
+
+  it('updates the simple vocab badge without re-fetching /api/vocab-info', async () => {
+    vi.stubGlobal('fetch', makeAddFetch());
+    await addUnknownToken();
+
+    await waitFor(() => {
+      expect(screen.getByText(/simple vocab: 17,577 tokens/i)).toBeInTheDocument();
+    });
+    const vocabInfoCalls = fetch.mock.calls.filter(([url]) => url.includes('vocab-info'));
+    expect(vocabInfoCalls).toHaveLength(1);
+  });
+
+  it('re-fetches /api/vocab-info if the initial load failed', async () => {
+    vi.stubGlobal('fetch', makeAddFetch({ vocabInfoOk: false }));
+    await addUnknownToken();
+
+    await waitFor(() => {
+      const vocabInfoCalls = fetch.mock.calls.filter(([url]) => url.includes('vocab-info'));
+      expect(vocabInfoCalls).toHaveLength(2);
+    });
+  });
+});
+
 // ─────────────────────────────────────────────
 // Error state
 // ─────────────────────────────────────────────
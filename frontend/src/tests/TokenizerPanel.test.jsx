@@ -247,7 +247,7 @@ describe('TokenizerPanel — review panel', () => {
     fireEvent.click(screen.getByRole('button', { name: /approve & add/i }));
 
     await waitFor(() => {
-      expect(onTokensAdded).toHaveBeenCalled();
+      expect(onTokensAdded).toHaveBeenCalledWith(17577);
     });
   });
 